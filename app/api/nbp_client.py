@@ -1,5 +1,12 @@
+from __future__ import annotations
+
+import orjson
 import requests
 from datetime import date
+from time import monotonic
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from app.error.exceptions import (
     CurrencyNotFoundError,
     InvalidApiResponseError
@@ -22,12 +29,47 @@ class NBPClient:
 
     BASE_URL = "https://api.nbp.pl/api"
     TABLE = "A"
+    HEADERS = MappingProxyType({
+        "Accept": "application/json",
+        "Connection": "keep-alive"
+    })
+    # Ranges reaching today may still change when today's table is
+    # published, so they are cached for a limited time only (seconds).
+    CURRENT_RATES_TTL = 3600
 
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self.headers = {
-            "Accept": "application/json"
-        }
+        self._rates_cache: dict[
+            tuple[str, date, date],
+            tuple[float | None, tuple[ExchangeRateDTO, ...]]
+        ] = {}
+
+        # A single pooled session keeps the TLS connection to api.nbp.pl alive
+        # between the per-chunk requests issued by the services.
+        self._session = requests.Session()
+        self._session.mount(
+            self.BASE_URL,
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[500, 502, 503, 504],
+                    raise_on_status=False
+                )
+            )
+        )
+        self._session.headers.update(self.HEADERS)
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> NBPClient:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     """
        Retrieves a chronological time series of exchange rates for a given currency
@@ -36,6 +78,8 @@ class NBPClient:
        The method queries the NBP REST API (exchange rate table A) and returns
        normalized exchange rate data mapped into immutable domain DTO objects.
        Returned data is sorted in ascending order by publication date.
+       Responses are cached per client instance: ranges that end before today
+       indefinitely, ranges reaching today for CURRENT_RATES_TTL seconds.
 
        Parameters
        ----------
@@ -60,13 +104,20 @@ class NBPClient:
         end_date: date
     ) -> list[ExchangeRateDTO]:
 
+        cache_key = (currency.upper(), start_date, end_date)
+        cached = self._rates_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_rates = cached
+            if expires_at is None or monotonic() < expires_at:
+                return list(cached_rates)
+
         url = (
             f"{self.BASE_URL}/exchangerates/rates/"
             f"{self.TABLE}/{currency}/"
             f"{start_date}/{end_date}/"
         )
 
-        response = requests.get(url, headers=self.headers, timeout=self.timeout)
+        response = self._session.get(url, timeout=self.timeout)
 
         if response.status_code == 404:
             raise CurrencyNotFoundError(
@@ -78,7 +129,7 @@ class NBPClient:
                 f"NBP API error {response.status_code}: {response.text}"
             )
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         rates = [
             ExchangeRateDTO(
@@ -88,7 +139,13 @@ class NBPClient:
             for rate in data["rates"]
         ]
 
-        rates.sort(key=lambda r: r.date, reverse=True)
+        # Published rates never change, so fully historical ranges never
+        # expire; a range reaching today is kept for CURRENT_RATES_TTL only.
+        if end_date < date.today():
+            expires_at = None
+        else:
+            expires_at = monotonic() + self.CURRENT_RATES_TTL
+        self._rates_cache[cache_key] = (expires_at, tuple(rates))
 
         return rates
 
@@ -120,7 +177,7 @@ class NBPClient:
             f"{self.TABLE}/{currency}/"
         )
 
-        response = requests.get(url, headers=self.headers, timeout=self.timeout)
+        response = self._session.get(url, timeout=self.timeout)
 
         if response.status_code == 404:
             raise CurrencyNotFoundError(
@@ -132,7 +189,7 @@ class NBPClient:
                 f"NBP API error {response.status_code}: {response.text}"
             )
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         return ExchangeRateDTO(
             date=date.fromisoformat(data["rates"][0]["effectiveDate"]),
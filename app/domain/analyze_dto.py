@@ -34,7 +34,7 @@ from typing import Dict, List
             - "unchanged": number of sessions where the rate stayed the same
 """
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalyzeDTO:
     currency: str
     start_date: date
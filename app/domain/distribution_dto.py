@@ -21,7 +21,7 @@ from typing import List
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DistributionDTO:
     currency_pair: str
     start_date: date
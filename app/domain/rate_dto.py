@@ -19,7 +19,7 @@ from datetime import date
         from NBP exchange rate table A.
 """
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExchangeRateDTO:
     date: date
     value: float
@@ -1,7 +1,8 @@
+import re
 import sys
 import shlex
 import argparse
-from datetime import datetime, date
+from datetime import date
 
 from app.api.nbp_client import NBPClient
 from app.services.analyze_service import CurrencyAnalysisService
@@ -10,6 +11,9 @@ from app.services.distribution_service import DistributionService
 # Constant from SRS (FR-07 Data Constraint)
 MIN_DATE = date(2002, 1, 2)
 
+# Strict YYYY-MM-DD shape; date.fromisoformat alone also accepts e.g. 20230501.
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 
 def validate_date(date_str):
     """
@@ -20,8 +24,11 @@ def validate_date(date_str):
     if not date_str:
         return date.today()
 
+    if not _DATE_RE.fullmatch(date_str):
+        raise ValueError("Error: Invalid date format. Please use YYYY-MM-DD.")
+
     try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
+        dt = date.fromisoformat(date_str)
     except ValueError:
         raise ValueError("Error: Invalid date format. Please use YYYY-MM-DD.")
 
@@ -86,82 +93,84 @@ def main():
     print("Welcome to Currency Exchange Rate Statistical Analysis System")
     print("Type 'help' for available commands or 'exit' to quit.")
 
-    # Main Program Loop
-    while True:
-        try:
-            # Get user input
-            user_input = input("\nNBP_APP> ").strip()
-
-            # Handle empty input
-            if not user_input:
+    # One client for the whole session: its connection pool and rate cache
+    # are reused by every command, and it is closed however the loop ends.
+    with NBPClient() as nbp_client:
+
+        # Main Program Loop
+        while True:
+            try:
+                # Get user input
+                user_input = input("\nNBP_APP> ").strip()
+
+                # Handle empty input
+                if not user_input:
+                    continue
+
+                # Handle exit commands
+                if user_input.lower() in ['exit']:
+                    print("Exiting application...")
+                    break
+
+                # Handle help command manually
+                if user_input.lower() in ['help']:
+                    parser.print_help()
+                    continue
+
+                # Parse arguments
+                args_list = shlex.split(user_input)
+                args = parser.parse_args(args_list)
+
+                # Input Logic Validation
+                # This is the 'Anchor date' (end date of the range)
+                anchor_date = validate_date(args.start)
+
+                if args.period == '1-quarter':
+                    valid_months = [1, 4, 7, 10]
+                    if anchor_date.day != 1 or anchor_date.month not in valid_months:
+                        raise ValueError(
+                            "Error: For '1-quarter', the start date must be the first day of a calendar quarter (Jan 1, Apr 1, Jul 1, Oct 1).")
+
+                if args.command == 'analyze':
+
+                    service = CurrencyAnalysisService(nbp_client)
+
+                    result = service.analyze_command(
+                        currency=args.currency.upper(),
+                        period=args.period,
+                        start=anchor_date.strftime("%Y-%m-%d")
+                    )
+
+                    service.display_analysis(result)
+
+                elif args.command == 'change-distribution':
+
+                    c1 = args.currency_1.upper()
+                    c2 = args.currency_2.upper()
+
+                    if c1 == c2:
+                        raise ValueError(
+                            f"Error: Currency pair must consist of two different currencies.")
+
+                    service = DistributionService(nbp_client)
+
+                    result = service.calculate_distribution(
+                        currency_1=c1,
+                        currency_2=c2,
+                        period=args.period,
+                        start=anchor_date.strftime("%Y-%m-%d")
+                    )
+                    service.display_histogram(result)
+
+            except ValueError as e:
+                # Handle validation errors (both date and syntax)
+                print(f"{e}")
+            except Exception as e:
+                # Handle unexpected errors
+                print(f"Unexpected error: {e}")
+            except SystemExit:
                 continue
 
-            # Handle exit commands
-            if user_input.lower() in ['exit']:
-                print("Exiting application...")
-                break
-
-            # Handle help command manually
-            if user_input.lower() in ['help']:
-                parser.print_help()
-                continue
-
-            # Parse arguments
-            args_list = shlex.split(user_input)
-            args = parser.parse_args(args_list)
-
-            # Input Logic Validation
-            # This is the 'Anchor date' (end date of the range)
-            anchor_date = validate_date(args.start)
-
-            if args.period == '1-quarter':
-                valid_months = [1, 4, 7, 10]
-                if anchor_date.day != 1 or anchor_date.month not in valid_months:
-                    raise ValueError(
-                        "Error: For '1-quarter', the start date must be the first day of a calendar quarter (Jan 1, Apr 1, Jul 1, Oct 1).")
-
-            if args.command == 'analyze':
-
-                nbp_client = NBPClient()
-                service = CurrencyAnalysisService(nbp_client)
-
-                result = service.analyze_command(
-                    currency=args.currency.upper(),
-                    period=args.period,
-                    start=anchor_date.strftime("%Y-%m-%d")
-                )
-
-                service.display_analysis(result)
-
-            elif args.command == 'change-distribution':
-
-                c1 = args.currency_1.upper()
-                c2 = args.currency_2.upper()
-
-                if c1 == c2:
-                    raise ValueError(
-                        f"Error: Currency pair must consist of two different currencies.")
-
-                nbp_client = NBPClient()
-                service = DistributionService(nbp_client)
-
-                result = service.calculate_distribution(
-                    currency_1=args.currency_1.upper(),
-                    currency_2=args.currency_2.upper(),
-                    period=args.period,
-                    start=anchor_date.strftime("%Y-%m-%d")
-                )
-                service.display_histogram(result)
-
-        except ValueError as e:
-            # Handle validation errors (both date and syntax)
-            print(f"{e}")
-        except Exception as e:
-            # Handle unexpected errors
-            print(f"Unexpected error: {e}")
-        except SystemExit:
-            continue
-
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from datetime import date, datetime
-from statistics import mean, median, variance, stdev
-from collections import Counter
+from datetime import date
+from itertools import chain
+
+import numpy as np
 
 from app.api.nbp_client import NBPClient
 from app.domain.analyze_dto import AnalyzeDTO
 from app.error.exceptions import InvalidDateRangeError
 
+from app.util.fetch_executor import FETCH_EXECUTOR
 from app.util.period_calculator import PeriodCalculator
 
 """
@@ -39,7 +41,8 @@ class CurrencyAnalysisService:
            1-month, 1-year) using PeriodCalculator.
         3. Splits the date range into chunks that comply with the NBP API maximum
            request length (93 days) to avoid API errors.
-        4. Fetches exchange rate data for each chunk via NBPClient and aggregates it.
+        4. Fetches exchange rate data for all chunks concurrently via NBPClient
+           and aggregates it in chronological order.
         5. Validates that there are at least two data points; otherwise, raises
            InvalidDateRangeError.
         6. Computes statistical measures:
@@ -81,7 +84,7 @@ class CurrencyAnalysisService:
     ) -> AnalyzeDTO:
 
         end_date = (
-            datetime.strptime(start, "%Y-%m-%d").date()
+            date.fromisoformat(start)
             if start
             else date.today()
         )
@@ -91,50 +94,62 @@ class CurrencyAnalysisService:
             period=period
         )
 
-        rates = []
-
         date_ranges = PeriodCalculator.split_date_range(start_date, end_date)
 
-        for range_start, range_end in date_ranges:
-            partial_rates = self.nbp_client.get_currency_rates_for_given_period(
+        # Chunk requests are independent and I/O-bound, so they are issued
+        # concurrently; map() preserves the chronological order of the chunks.
+        partial_rates = list(FETCH_EXECUTOR.map(
+            lambda date_range: self.nbp_client.get_currency_rates_for_given_period(
                 currency=currency,
-                start_date=range_start,
-                end_date=range_end
-            )
-            rates.extend(partial_rates)
+                start_date=date_range[0],
+                end_date=date_range[1]
+            ),
+            date_ranges
+        ))
+
+        rate_count = sum(len(chunk) for chunk in partial_rates)
 
-        if len(rates) < 2:
+        if rate_count < 2:
             raise InvalidDateRangeError(
                 "Not enough exchange rate data for analysis."
             )
 
-        values = [r.value for r in rates]
+        # Values are read straight from the chunks into a preallocated array,
+        # without first flattening them into an intermediate list.
+        values = np.fromiter(
+            (r.value for r in chain.from_iterable(partial_rates)),
+            dtype=np.float64,
+            count=rate_count
+        )
 
+        # Median and modes are both read off a single sorted copy.
+        sorted_values = np.sort(values)
 
-        med = median(values)
+        mid = rate_count // 2
+        if rate_count % 2:
+            med = float(sorted_values[mid])
+        else:
+            med = float((sorted_values[mid - 1] + sorted_values[mid]) / 2)
 
-        freq = Counter(values)
-        max_freq = max(freq.values())
+        # Each run of equal values in the sorted array is one distinct rate.
+        run_starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+        counts = np.diff(np.r_[run_starts, rate_count])
+        max_freq = int(counts.max())
 
         if max_freq == 1:
             modes = []
         else:
-            modes = [v for v, c in freq.items() if c == max_freq]
+            modes = sorted_values[run_starts[counts == max_freq]].tolist()
 
-        std = stdev(values)
+        std = float(values.std(ddof=1))
 
-        avg = mean(values)
+        avg = float(values.mean())
         coeff_var = std / avg
 
-        increases = decreases = unchanged = 0
-
-        for prev, curr in zip(values, values[1:]):
-            if curr > prev:
-                increases += 1
-            elif curr < prev:
-                decreases += 1
-            else:
-                unchanged += 1
+        diff = np.diff(values)
+        increases = int(np.count_nonzero(diff > 0))
+        decreases = int(np.count_nonzero(diff < 0))
+        unchanged = diff.size - increases - decreases
 
         return AnalyzeDTO(
             currency=currency.upper(),
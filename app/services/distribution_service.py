@@ -1,12 +1,16 @@
 from __future__ import annotations
-from datetime import date, datetime
-from typing import List, Tuple
+from datetime import date
+from typing import Iterator, List, Tuple
+from itertools import chain
 import math
 
+import numpy as np
+
 from app.api.nbp_client import NBPClient
 from app.domain.rate_dto import ExchangeRateDTO
 from app.domain.distribution_dto import DistributionDTO
 from app.error.exceptions import InvalidDateRangeError
+from app.util.fetch_executor import FETCH_EXECUTOR
 from app.util.period_calculator import PeriodCalculator
 
 """
@@ -28,25 +32,31 @@ class DistributionService:
             start: str | None
     ) -> DistributionDTO:
 
+        # A currency against itself is constantly 1.0 (PLN/PLN included), so
+        # it is rejected before any request is sent to the NBP API.
+        if currency_1.upper() == currency_2.upper():
+            raise ValueError("Currency pair must consist of two different currencies")
+
         end_date = (
-            datetime.strptime(start, "%Y-%m-%d").date()
+            date.fromisoformat(start)
             if start
             else date.today()
         )
         start_date = PeriodCalculator.calculate_start_date(end_date, period)
 
-        rates_1 = self._get_rates_or_pln(currency_1, start_date, end_date)
-        rates_2 = self._get_rates_or_pln(currency_2, start_date, end_date)
+        # Chunk requests of both currencies are queued on the shared pool
+        # before either result is awaited, so they all run concurrently.
+        chunks_1 = self._get_rates_or_pln(currency_1, start_date, end_date)
+        chunks_2 = self._get_rates_or_pln(currency_2, start_date, end_date)
+        rates_1 = list(chain.from_iterable(chunks_1))
+        rates_2 = list(chain.from_iterable(chunks_2))
 
         pair_rates = self._calculate_pair_rates(rates_1, rates_2)
 
         if len(pair_rates) < 2:
             raise InvalidDateRangeError("Not enough aligned data points to calculate changes.")
 
-        changes = []
-        for i in range(1, len(pair_rates)):
-            change = pair_rates[i] - pair_rates[i - 1]
-            changes.append(change)
+        changes = np.diff(pair_rates).tolist()
 
         return DistributionDTO(
             currency_pair=f"{currency_1}/{currency_2}",
@@ -65,9 +75,12 @@ class DistributionService:
             print("No data to display.")
             return
 
-        print(f"\nDistribution for {dto.currency_pair} ({dto.start_date} - {dto.end_date})")
-        print("Y-axis: Frequency (days) | X-axis: Change bins")
-        print("-" * 70)
+        # The whole chart is collected first and written with a single print.
+        lines = [
+            f"\nDistribution for {dto.currency_pair} ({dto.start_date} - {dto.end_date})",
+            "Y-axis: Frequency (days) | X-axis: Change bins",
+            "-" * 70
+        ]
 
         # --- 1. Dynamic Configuration (Bins) ---
         days_diff = (dto.end_date - dto.start_date).days
@@ -83,50 +96,31 @@ class DistributionService:
         max_val = max(changes)
 
         if max_val == min_val:
-            bin_width = 1.0
+            # Constant series: unit-width bins starting at the single value.
+            hist_range = (min_val, min_val + num_bins)
         else:
-            bin_width = (max_val - min_val) / num_bins
+            hist_range = (min_val, max_val)
 
         # --- 2. Bucketize Data ---
-        bins_counts = [0] * num_bins
-        bin_ranges = []
-        for i in range(num_bins):
-            low = min_val + i * bin_width
-            high = min_val + (i + 1) * bin_width
-            bin_ranges.append((low, high))
-
-        for val in changes:
-            if val == max_val:
-                idx = num_bins - 1
-            else:
-                idx = int((val - min_val) / bin_width)
-                idx = min(idx, num_bins - 1)
-                idx = max(idx, 0)
-            bins_counts[idx] += 1
+        # np.histogram keeps max_val in the last (closed) bin.
+        counts, edges = np.histogram(changes, bins=num_bins, range=hist_range)
+        bins_counts = counts.tolist()
+        bin_ranges = list(zip(edges[:-1].tolist(), edges[1:].tolist()))
 
         # --- 3. Draw Vertical Histogram ---
         max_freq = max(bins_counts) if bins_counts else 0
 
         for row in range(max_freq, 0, -1):
-            line = f"{row:>3} | "
-
-            for count in bins_counts:
-                if count >= row:
-                    line += " #### "
-                else:
-                    line += "      "
-            print(line)
+            bars = "".join(" #### " if count >= row else "      " for count in bins_counts)
+            lines.append(f"{row:>3} | {bars}")
 
         # --- 4. Draw X-axis ---
         # Padding "    " aligns the '+' with the '|' above
-        print("    " + "+-----" * num_bins + "+")
+        lines.append("    " + "+-----" * num_bins + "+")
 
         # --- 5. Draw Bin Indices ---
-        labels_line = "     "
-        for i in range(num_bins):
-            labels_line += f" ({i + 1:<2}) "
-        print(labels_line)
-        print("-" * 70)
+        lines.append("     " + "".join(f" ({i + 1:<2}) " for i in range(num_bins)))
+        lines.append("-" * 70)
 
         # --- 6. Print Legend ---
         try:
@@ -134,7 +128,7 @@ class DistributionService:
         except:
             unit = "PLN"
 
-        print(f"Legend (Ranges in {unit}):")
+        lines.append(f"Legend (Ranges in {unit}):")
         half = (num_bins + 1) // 2
         for i in range(half):
             r1_low, r1_high = bin_ranges[i]
@@ -143,32 +137,48 @@ class DistributionService:
             if i + half < num_bins:
                 r2_low, r2_high = bin_ranges[i + half]
                 col2 = f"({i + half + 1:<2}): [{r2_low:+.4f}, {r2_high:+.4f})"
-                print(f"{col1:<35} | {col2}")
+                lines.append(f"{col1:<35} | {col2}")
             else:
-                print(f"{col1}")
+                lines.append(col1)
+
+        print("\n".join(lines))
 
     # --- Helper Methods ---
-    def _get_rates_or_pln(self, currency: str, start: date, end: date) -> List[ExchangeRateDTO]:
+    def _get_rates_or_pln(self, currency: str, start: date, end: date) -> Iterator[List[ExchangeRateDTO]]:
         if currency.upper() == 'PLN':
-            return []
+            return iter([])
 
-        rates = []
+        # Executor.map submits every chunk immediately and yields the results
+        # in chronological order.
         date_ranges = PeriodCalculator.split_date_range(start, end)
-        for r_start, r_end in date_ranges:
-            rates.extend(self.nbp_client.get_currency_rates_for_given_period(currency, r_start, r_end))
-
-        rates.sort(key=lambda r: r.date)
-        return rates
+        return FETCH_EXECUTOR.map(
+            lambda date_range: self.nbp_client.get_currency_rates_for_given_period(currency, *date_range),
+            date_ranges
+        )
 
-    def _calculate_pair_rates(self, rates_a: List[ExchangeRateDTO], rates_b: List[ExchangeRateDTO]) -> List[float]:
+    def _calculate_pair_rates(self, rates_a: List[ExchangeRateDTO], rates_b: List[ExchangeRateDTO]) -> np.ndarray:
         if rates_a and rates_b:
-            dict_a = {r.date: r.value for r in rates_a}
-            dict_b = {r.date: r.value for r in rates_b}
-            common_dates = sorted(list(set(dict_a.keys()) & set(dict_b.keys())))
-            return [dict_a[d] / dict_b[d] for d in common_dates]
+            # Align both series on their common publication dates (ascending).
+            _, idx_a, idx_b = np.intersect1d(
+                self._ordinals(rates_a),
+                self._ordinals(rates_b),
+                assume_unique=True,
+                return_indices=True
+            )
+            return self._values(rates_a)[idx_a] / self._values(rates_b)[idx_b]
 
         elif not rates_a and rates_b:
-            return [1.0 / r.value for r in rates_b]
+            return 1.0 / self._values(rates_b)
 
         elif rates_a and not rates_b:
-            return [r.value / 1.0 for r in rates_a]
+            return self._values(rates_a)
+
+        return np.empty(0, dtype=np.float64)
+
+    @staticmethod
+    def _ordinals(rates: List[ExchangeRateDTO]) -> np.ndarray:
+        return np.fromiter((r.date.toordinal() for r in rates), dtype=np.int64, count=len(rates))
+
+    @staticmethod
+    def _values(rates: List[ExchangeRateDTO]) -> np.ndarray:
+        return np.fromiter((r.value for r in rates), dtype=np.float64, count=len(rates))
@@ -0,0 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
+"""
+    Thread pool shared by the services for fetching NBP rate chunks.
+
+    The chunk requests are I/O-bound, so running them on threads overlaps
+    the network round-trips. Four workers cover the longest request burst:
+    a 1-year analysis split into four MAX_DAYS chunks. A change-distribution
+    ('1-month' or '1-quarter') needs at most one chunk per currency.
+"""
+
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4)
@@ -1,8 +1,19 @@
 from datetime import date, timedelta
+from functools import lru_cache
 import calendar
 
 MAX_DAYS = 93
 
+# Maps each supported period to a function computing its start date.
+_PERIOD_OFFSETS = {
+    "1-week": lambda d: d - timedelta(weeks=1),
+    "2-weeks": lambda d: d - timedelta(weeks=2),
+    "1-month": lambda d: PeriodCalculator._subtract_months(d, 1),
+    "1-quarter": lambda d: PeriodCalculator._subtract_months(d, 3),
+    "6-months": lambda d: PeriodCalculator._subtract_months(d, 6),
+    "1-year": lambda d: PeriodCalculator._subtract_years(d, 1),
+}
+
 """
    Utility class for calculating date ranges based on predefined periods
    for currency exchange rate analysis.
@@ -38,26 +49,17 @@ class PeriodCalculator:
     """
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def calculate_start_date(
         end_date: date,
         period: str
     ) -> date:
-        start_date = None
-
-        if period == "1-week":
-            start_date = end_date - timedelta(weeks=1)
-        elif period == "2-weeks":
-            start_date = end_date - timedelta(weeks=2)
-        elif period == "1-month":
-            start_date = PeriodCalculator._subtract_months(end_date, 1)
-        elif period == "1-quarter":
-            start_date = PeriodCalculator._subtract_months(end_date, 3)
-        elif period == "6-months":
-            start_date = PeriodCalculator._subtract_months(end_date, 6)
-        elif period == "1-year":
-            start_date = PeriodCalculator._subtract_years(end_date, 1)
-        else:
-            raise ValueError(f"Unsupported period: {period}")
+        try:
+            offset = _PERIOD_OFFSETS[period]
+        except KeyError:
+            raise ValueError(f"Unsupported period: {period}") from None
+
+        start_date = offset(end_date)
 
         # Ensure start date is not before NBP data limit (2002-01-02)
         min_allowed_date = date(2002, 1, 2)
@@ -133,18 +135,24 @@ class PeriodCalculator:
             The start date of the full range.
         end : date
             The end date of the full range.
-    """
 
-    def split_date_range(start: date, end: date) -> list[tuple[date, date]]:
-        ranges = []
-        current_start = start
+        Returns
+        -------
+        tuple[tuple[date, date], ...]
+            Immutable sequence of (start, end) pairs, so results can be cached.
+    """
 
-        while current_start <= end:
-            current_end = min(
-                current_start + timedelta(days=MAX_DAYS - 1),
-                end
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def split_date_range(start: date, end: date) -> tuple[tuple[date, date], ...]:
+        # Number of MAX_DAYS chunks needed to cover the inclusive range
+        # (zero when end precedes start).
+        chunk_count = ((end - start).days + MAX_DAYS) // MAX_DAYS
+
+        return tuple(
+            (
+                start + timedelta(days=i * MAX_DAYS),
+                min(start + timedelta(days=(i + 1) * MAX_DAYS - 1), end)
             )
-            ranges.append((current_start, current_end))
-            current_start = current_end + timedelta(days=1)
-
-        return ranges
\ No newline at end of file
+            for i in range(chunk_count)
+        )
\ No newline at end of file
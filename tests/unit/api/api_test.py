@@ -0,0 +1,100 @@
+import pytest
+from unittest.mock import patch
+from datetime import date
+
+from app.error.exceptions import CurrencyNotFoundError, InvalidApiResponseError
+from app.api.nbp_client import NBPClient
+from app.domain.rate_dto import ExchangeRateDTO
+
+from tests.unit.mock.nbp_response_mock import mock_nbp_response, mock_nbp_error_response
+
+
+def test_exchange_rate_dto_repr():
+    rate = ExchangeRateDTO(date=date(2025, 12, 16), value=3.593)
+    assert repr(rate) == "ExchangeRateDTO((2025, 12, 16), 3.593)"
+
+@patch("app.api.nbp_client.requests.Session.get")
+def test_get_current_exchange_rate(mock_get):
+    mock_get.return_value = mock_nbp_response("USD", [("2025-12-16", 3.593)])
+
+    client = NBPClient()
+    rate = client.get_current_exchange_rate("USD")
+
+    assert isinstance(rate, ExchangeRateDTO)
+    assert rate.date == date(2025, 12, 16)
+    assert rate.value == 3.593
+    assert repr(rate) == "ExchangeRateDTO((2025, 12, 16), 3.593)"
+
+
+@patch("app.api.nbp_client.requests.Session.get")
+def test_get_currency_rates_for_given_period(mock_get):
+    mock_get.return_value = mock_nbp_response(
+        "EUR", [("2025-12-15", 4.123), ("2025-12-16", 4.134)]
+    )
+
+    client = NBPClient()
+    rates = client.get_currency_rates_for_given_period(
+        "EUR", date(2025, 12, 15), date(2025, 12, 16)
+    )
+
+    assert len(rates) == 2
+    assert all(isinstance(r, ExchangeRateDTO) for r in rates)
+    assert rates[0].date == date(2025, 12, 15)
+    assert rates[0].value == 4.123
+    assert rates[1].date == date(2025, 12, 16)
+    assert rates[1].value == 4.134
+
+    assert repr(rates[1]) == "ExchangeRateDTO((2025, 12, 16), 4.134)"
+
+
+@patch("app.api.nbp_client.requests.Session.get")
+def test_currency_not_found_error(mock_get):
+    mock_get.return_value = mock_nbp_error_response(404, "Not Found")
+
+    client = NBPClient()
+    with pytest.raises(CurrencyNotFoundError):
+        client.get_current_exchange_rate("ABC")
+
+@patch("app.api.nbp_client.requests.Session.get")
+def test_server_error(mock_get):
+    mock_get.return_value = mock_nbp_error_response(500, "Internal Server Error")
+
+    client = NBPClient()
+
+    with pytest.raises(InvalidApiResponseError) as exc:
+        client.get_current_exchange_rate("USD")
+    assert "NBP API error 500" in str(exc.value)
+
+@patch("app.api.nbp_client.requests.Session.get")
+def test_historical_rates_are_cached(mock_get):
+    mock_get.return_value = mock_nbp_response("EUR", [("2025-12-15", 4.123)])
+
+    client = NBPClient()
+    first = client.get_currency_rates_for_given_period(
+        "EUR", date(2025, 12, 15), date(2025, 12, 16)
+    )
+    second = client.get_currency_rates_for_given_period(
+        "EUR", date(2025, 12, 15), date(2025, 12, 16)
+    )
+
+    assert mock_get.call_count == 1
+    assert first == second
+
+
+@patch("app.api.nbp_client.monotonic")
+@patch("app.api.nbp_client.requests.Session.get")
+def test_rates_reaching_today_expire_from_cache(mock_get, mock_monotonic):
+    mock_get.return_value = mock_nbp_response("EUR", [("2025-12-15", 4.123)])
+
+    client = NBPClient()
+    today = date.today()
+
+    mock_monotonic.return_value = 0.0
+    client.get_currency_rates_for_given_period("EUR", date(2025, 12, 15), today)
+    mock_monotonic.return_value = NBPClient.CURRENT_RATES_TTL - 1
+    client.get_currency_rates_for_given_period("EUR", date(2025, 12, 15), today)
+    assert mock_get.call_count == 1
+
+    mock_monotonic.return_value = NBPClient.CURRENT_RATES_TTL + 1
+    client.get_currency_rates_for_given_period("EUR", date(2025, 12, 15), today)
+    assert mock_get.call_count == 2
@@ -41,14 +41,20 @@ def test_validate_date_invalid_format():
         validate_date("not-a-date")
 
 
+@pytest.mark.parametrize("date_str", ["2024-1-5", "20240105"])
+def test_validate_date_rejects_non_strict_iso_format(date_str):
+    """Verifies that only the strict YYYY-MM-DD shape is accepted."""
+    with pytest.raises(ValueError, match="Invalid date format"):
+        validate_date(date_str)
+
+
 # ==========================================
 # MAIN LOOP & COMMAND ROUTING TESTS
 # ==========================================
 
 @patch('builtins.input')  # Mocks user input
-@patch('builtins.print')  # Mocks console output (to keep test clean)
 @patch('app.main.NBPClient')  # Mocks API connection
-def test_main_prevents_same_currency(mock_client, mock_print, mock_input):
+def test_main_prevents_same_currency(mock_client, mock_input, capsys):
     """
     Verifies that comparing the same currency (USD vs USD) triggers an error
     and does NOT call the service.
@@ -65,11 +71,8 @@ def test_main_prevents_same_currency(mock_client, mock_print, mock_input):
     except SystemExit:
         pass
 
-    # Collect all print calls to check for the error message
-    # We join all printed arguments into one long string
-    printed_text = " ".join(
-        [str(call.args[0]) for call in mock_print.call_args_list if call.args]
-    )
+    # Collect everything printed to stdout to check for the error message
+    printed_text = capsys.readouterr().out
 
     assert "Currency pair must consist of two different currencies" in printed_text
 
@@ -111,4 +114,15 @@ def test_main_routes_to_distribution_service(mock_client, mock_service_class, mo
     assert call_kwargs['period'] == '1-month'
 
     # 3. Check if display was called
-    mock_service_instance.display_histogram.assert_called_once_with("FakeDTO")
\ No newline at end of file
+    mock_service_instance.display_histogram.assert_called_once_with("FakeDTO")
+
+@patch('builtins.input')
+@patch('app.main.NBPClient')
+def test_main_closes_client_on_keyboard_interrupt(mock_client, mock_input):
+    """Verifies that the NBP client is closed even when the user presses Ctrl-C."""
+    mock_input.side_effect = KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        main()
+
+    mock_client.return_value.__exit__.assert_called_once()
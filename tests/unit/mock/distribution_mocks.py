@@ -7,6 +7,8 @@ class MockRate:
     Simulates ExchangeRateDTO but allows easy date manipulation via offsets.
     """
 
+    __slots__ = ("value", "date")
+
     def __init__(self, value: float, day_offset: int):
         self.value = value
         # Start date is January 1st, 2024 + offset days
@@ -1,16 +1,23 @@
 from tests.unit.mock.exchange_rate_mock import FakeRate
 
+# Rates are built once at import time; the mocks hand out the same tuples.
+_RATES = tuple(
+    FakeRate(r) for r in (4.00, 4.11, 4.05, 4.05, 4.07, 4.15, 4.10, 4.12, 4.05, 4.08)
+)
+_RATES_NO_MODE = tuple(
+    FakeRate(r) for r in (4.01, 4.03, 4.05, 4.07, 4.09, 4.11, 4.13, 4.15, 4.17, 4.19)
+)
+_RATES_SINGLE_VALUE = (FakeRate(4.00),)
+
 
 class MockNBPClient:
     def get_currency_rates_for_given_period(self, currency, start_date, end_date):
-        rates = [4.00, 4.11, 4.05, 4.05, 4.07, 4.15, 4.10, 4.12, 4.05, 4.08]
-        return [FakeRate(r) for r in rates]
+        return _RATES
 
 class MockNBPClientNoMode:
     def get_currency_rates_for_given_period(self, currency, start_date, end_date):
-        rates = [4.01, 4.03, 4.05, 4.07, 4.09, 4.11, 4.13, 4.15, 4.17, 4.19]
-        return [FakeRate(r) for r in rates]
+        return _RATES_NO_MODE
 
 class MockNBPClientSingleValue:
     def get_currency_rates_for_given_period(self, currency, start_date, end_date):
-        return [FakeRate(4.00)]
\ No newline at end of file
+        return _RATES_SINGLE_VALUE
@@ -0,0 +1,29 @@
+from unittest.mock import Mock
+
+import orjson
+
+
+def mock_nbp_response(code: str, rates: list[tuple[str, float]]) -> Mock:
+    """
+    Successful NBP API (table A) response mock.
+    Rates are given as (effectiveDate, mid) pairs.
+    """
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.content = orjson.dumps({
+        "table": "A",
+        "currency": code,
+        "code": code,
+        "rates": [{"effectiveDate": d, "mid": mid} for d, mid in rates]
+    })
+    return response
+
+
+def mock_nbp_error_response(status_code: int, text: str) -> Mock:
+    """Failed NBP API response mock."""
+    response = Mock()
+    response.ok = False
+    response.status_code = status_code
+    response.text = text
+    return response
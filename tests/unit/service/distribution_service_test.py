@@ -1,5 +1,6 @@
 import pytest
 from datetime import date
+from unittest.mock import Mock
 
 from app.services.distribution_service import DistributionService
 from app.domain.distribution_dto import DistributionDTO
@@ -51,6 +52,17 @@ def test_calculate_distribution_not_enough_data():
         service.calculate_distribution("USD", "EUR", "1-week", "2024-01-10")
 
 
+def test_calculate_distribution_same_currency_skips_fetch():
+    """Verifies that a currency paired with itself is rejected without fetching rates."""
+    client = Mock()
+    service = DistributionService(client)
+
+    with pytest.raises(ValueError, match="two different currencies"):
+        service.calculate_distribution("usd", "USD", "1-week", "2024-01-10")
+
+    client.get_currency_rates_for_given_period.assert_not_called()
+
+
 def test_display_histogram_output_structure(capsys):
     """
     Verifies if display_histogram actually prints the ASCII chart.
@@ -107,4 +119,38 @@ def test_display_histogram_dynamic_bins_quarter(capsys):
 
     captured = capsys.readouterr()
     # Check if the last index (12) appears in the legend
-    assert "(12)" in captured.out
\ No newline at end of file
+    assert "(12)" in captured.out
+
+def _filled_bins(output: str, row: int) -> list[int]:
+    """Returns 1-based indices of bins drawn at the given histogram row."""
+    prefix = f"{row:>3} | "
+    line = next(l for l in output.splitlines() if l.startswith(prefix))
+    bars = line[len(prefix):]
+    return [i // 6 + 1 for i in range(0, len(bars), 6) if "####" in bars[i:i + 6]]
+
+
+def test_display_histogram_constant_changes_in_first_bin(capsys):
+    """Verifies that an all-equal series lands in the first bin, which starts at its value."""
+    service = DistributionService(MyMockNBPClient())
+
+    dto = DistributionDTO("A/B", date(2024, 1, 1), date(2024, 1, 10), changes=[0.1, 0.1, 0.1])
+
+    service.display_histogram(dto)
+
+    output = capsys.readouterr().out
+    assert _filled_bins(output, 3) == [1]
+    assert "(1 ): [+0.1000, +1.1000)" in output
+
+
+def test_display_histogram_edge_value_goes_to_upper_bin(capsys):
+    """Verifies that a value exactly on a bin edge is counted in the bin starting at that edge."""
+    service = DistributionService(MyMockNBPClient())
+
+    # 7 bins of width 1.0 over [0.0, 7.0]; 1.0 is the edge between bins 1 and 2.
+    dto = DistributionDTO("A/B", date(2024, 1, 1), date(2024, 1, 10), changes=[0.0, 1.0, 7.0])
+
+    service.display_histogram(dto)
+
+    output = capsys.readouterr().out
+    assert _filled_bins(output, 1) == [1, 2, 7]
+    assert "(2 ): [+1.0000, +2.0000)" in output
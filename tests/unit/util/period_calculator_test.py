@@ -46,7 +46,7 @@ def test_split_date_range_single_chunk():
     start = date(2024, 1, 1)
     end = date(2024, 3, 31)
     ranges = PeriodCalculator.split_date_range(start, end)
-    assert ranges == [(start, end)]
+    assert ranges == ((start, end),)
 
 def test_split_date_range_multiple_chunks():
     start = date(2024, 1, 1)